@@ -16,6 +16,8 @@ This file has various metadata dictionaries and methods
 that useful in resolving the dataset fields and also
 to derive new SV's
 """
+from functools import lru_cache
+
 _cols_dict = {
     "UNIVERSE":
         "Universe",
@@ -1030,6 +1032,7 @@ def _get_county_dict(dict_name: str) -> dict:
     return {}
 
 
+@lru_cache(maxsize=None)
 def _get_mapper_cols_dict(dict_name: str) -> dict:
     """
     Returns the required dictionary depending on
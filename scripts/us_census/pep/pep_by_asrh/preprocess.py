@@ -40,7 +40,8 @@ output_files - output files (mcf, tmcf and csv are written here)
 """
 
 import os
-from copy import deepcopy
+import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from absl import app
@@ -49,6 +50,10 @@ from constants import INPUT_DIRS, INPUT_DIR
 
 _CODEDIR = os.path.dirname(__file__)
 
+# Age tokens inside SV names, e.g. 85OrMoreYears, 5To9Years
+_AGE_OR_MORE_PATTERN = re.compile(r"^(\d+)OrMoreYears$")
+_AGE_RANGE_PATTERN = re.compile(r"^(\d+)To(\d+)Years$")
+
 _MCF_TEMPLATE = ("Node: dcid:{dcid}\n"
                  "typeOf: dcs:StatisticalVariable\n"
                  "populationType: dcs:Person\n"
@@ -68,8 +73,13 @@ _TMCF_TEMPLATE = (
 
 
 def _convert_to_int(data_df: pd.DataFrame) -> pd.DataFrame:
+    # Downcasting to the smallest integer dtype roughly halves the
+    # memory the numeric columns occupy, which speeds up the
+    # melt/groupby passes downstream.
     for col in data_df.columns:
-        data_df[col] = data_df[col].astype("int", errors="ignore")
+        data_df[col] = pd.to_numeric(data_df[col],
+                                     errors="ignore",
+                                     downcast="integer")
     return data_df
 
 
@@ -85,11 +95,127 @@ def _derive_cols(data_df: pd.DataFrame, derived_cols: dict) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame
     """
+    # Source columns repeat across derived columns; coercing each of
+    # them to numeric once up front avoids re-converting the shared
+    # ones in every iteration. No derived column feeds another, so the
+    # sums can all read from the coerced frame.
+    src_cols = list(
+        dict.fromkeys(col for sv in derived_cols.values() for col in sv))
+    data_df[src_cols] = data_df[src_cols].apply(pd.to_numeric)
     for dsv, sv in derived_cols.items():
-        data_df[dsv] = data_df.loc[:, sv].apply(pd.to_numeric).sum(axis=1)
+        data_df[dsv] = data_df[sv].sum(axis=1)
     return data_df
 
 
+def _derive_sum_svs(data_df: pd.DataFrame, derived_cols: dict,
+                    group_cols: list) -> pd.DataFrame:
+    """
+    Derives new SV rows by summing the source SV rows listed in
+    derived_cols. The source rows for every derived SV are labelled
+    and stacked first so a single groupby aggregates all of them in
+    one pass over data_df. The SV column is grouped as an ordered
+    Categorical, keeping the derived rows in derived_cols order with
+    each block sorted by the remaining group columns.
+    Args:
+        data_df (pd.DataFrame): Input DataFrame
+        derived_cols (dict): derived_cols dict
+                             where key represents dervied col and
+                             values represents existing columns.
+        group_cols (list): Grouping Columns including "SV"
+
+    Returns:
+        pd.DataFrame: DataFrame with derived SV rows
+    """
+    pieces = []
+    for dsv, sv in derived_cols.items():
+        piece = data_df[data_df["SV"].isin(sv)].copy()
+        piece["SV"] = dsv
+        pieces.append(piece)
+    derived_df = pd.concat(pieces, ignore_index=True)
+    derived_df["SV"] = pd.Categorical(derived_df["SV"],
+                                      categories=list(derived_cols),
+                                      ordered=True)
+    sort_cols = ["SV"] + [col for col in group_cols if col != "SV"]
+    derived_df = derived_df.groupby(sort_cols,
+                                    observed=True).sum().reset_index()
+    derived_df["SV"] = derived_df["SV"].astype("str")
+    return derived_df
+
+
+def _unpivot_df(data_df: pd.DataFrame,
+                id_vars: list,
+                value_vars: list,
+                var_name: str = "SV",
+                value_name: str = "Count_Person") -> pd.DataFrame:
+    """
+    Unpivots a DataFrame from wide to long format, producing the
+    same frame as pd.melt without materializing melt's intermediate
+    copies. Value columns are stacked block by block, id columns are
+    tiled to match.
+    Args:
+        data_df (pd.DataFrame): Input DataFrame in wide format.
+        id_vars (list): Columns to use as identifier variables.
+        value_vars (list): Columns to unpivot.
+        var_name (str, optional): Name for the variable column.
+        value_name (str, optional): Name for the value column.
+
+    Returns:
+        pd.DataFrame: DataFrame in long format
+    """
+    long_data = {}
+    for col in id_vars:
+        long_data[col] = np.tile(data_df[col].to_numpy(), len(value_vars))
+    long_data[var_name] = np.repeat(np.asarray(value_vars, dtype=object),
+                                    data_df.shape[0])
+    value_block = data_df[value_vars]
+    if all(
+            pd.api.types.is_numeric_dtype(dtype)
+            for dtype in value_block.dtypes):
+        # All-numeric value columns extract as one 2D array, and a
+        # column-major ravel stacks them without the per-column
+        # temporaries of the general path below.
+        long_data[value_name] = value_block.to_numpy().ravel(order="F")
+    else:
+        long_data[value_name] = np.concatenate(
+            [data_df[col].to_numpy() for col in value_vars])
+    return pd.DataFrame(long_data)
+
+
+def _to_geoid(codes: pd.Series, width: int) -> pd.Series:
+    """
+    Returns the geoId column for a FIPS code column. The codes repeat
+    heavily across rows, so each distinct code is zero-padded and
+    prefixed once and the result broadcast back with map.
+    Args:
+        codes (pd.Series): FIPS Code Column
+        width (int): Zero-padded FIPS Code Width
+
+    Returns:
+        pd.Series: geoId Column
+    """
+    geoid_mapper = {
+        code: "geoId/" + str(code).zfill(width) for code in codes.unique()
+    }
+    return codes.map(geoid_mapper)
+
+
+def _build_location(state: pd.Series, county: pd.Series) -> pd.Series:
+    """
+    Returns the county geoId column built from the STATE and COUNTY
+    FIPS code columns. The two codes are fused numerically into the
+    five digit county FIPS, so one integer operation replaces the
+    per-column zero padding and string concatenation, and the
+    formatting itself runs once per distinct county in _to_geoid.
+    Args:
+        state (pd.Series): State FIPS Code Column
+        county (pd.Series): County FIPS Code Column
+
+    Returns:
+        pd.Series: geoId Column
+    """
+    return _to_geoid(state.astype("int") * 1000 + county.astype("int"), 5)
+
+
 def _get_age_grp(age_grp: enumerate) -> str:
     """
     Returns Age Groups using age_grp index as below.
@@ -106,13 +232,7 @@ def _get_age_grp(age_grp: enumerate) -> str:
     Returns:
         str: Age Bucket Value
     """
-    if age_grp == 0:
-        return ""
-    if age_grp == 18:
-        return "85OrMore"
-    start = 5 * (age_grp - 1)
-    end = 5 * (age_grp) - 1
-    return f"{start}To{end}"
+    return _AGE_GRP_TABLE[age_grp]
 
 
 def _get_age_grp_county_2000_2009(age_grp: enumerate) -> str:
@@ -132,16 +252,37 @@ def _get_age_grp_county_2000_2009(age_grp: enumerate) -> str:
     Returns:
         str: Age Bucket Value
     """
-    if age_grp == 0:
-        return "0"
-    if age_grp == 1:
-        return "1To4"
-    if age_grp == 18:
-        return "85OrMore"
-    start = 5 * (age_grp - 1)
-    end = 5 * (age_grp) - 1
-    return f"{start}To{end}"
-
+    return _AGE_GRP_COUNTY_2000_2009_TABLE[age_grp]
+
+
+# Age bucket lookup tables indexed by AGEGRP, used to derive the Age
+# column in a single numpy gather instead of a per-row apply. The
+# scalar _get_age_grp* helpers above read from these same tables.
+_AGE_GRP_TABLE = np.array(
+    [""] + [f"{5 * (grp - 1)}To{5 * grp - 1}" for grp in range(1, 18)] +
+    ["85OrMore"],
+    dtype=object)
+
+_AGE_GRP_COUNTY_2000_2009_TABLE = np.array(
+    ["0", "1To4"] +
+    [f"{5 * (grp - 1)}To{5 * grp - 1}" for grp in range(2, 18)] + ["85OrMore"],
+    dtype=object)
+
+# Origin/Race category codes used in the county 1990-1999 files
+_SV_MAPPER = {
+    "1": "Male_WhiteAloneNotHispanicOrLatino",
+    "2": "Female_WhiteAloneNotHispanicOrLatino",
+    "3": "Male_HispanicOrLatino_WhiteAlone",
+    "4": "Female_HispanicOrLatino_WhiteAlone",
+    "5": "Male_BlackOrAfricanAmericanAlone",
+    "6": "Female_BlackOrAfricanAmericanAlone",
+    "7": "Male_AmericanIndianAndAlaskaNativeAlone",
+    "8": "Female_AmericanIndianAndAlaskaNativeAlone",
+    "9": "Male_AsianOrPacificIslander",
+    "10": "Female_AsianOrPacificIslander",
+    "11": "Male_HispanicOrLatino",
+    "12": "Female_HispanicOrLatino"
+}
 
 _COUNTY_2000_2009_INFO = {
     "year_range": "2000_2009",
@@ -151,7 +292,7 @@ _COUNTY_2000_2009_INFO = {
     "derived_cols_string": "county_2000_2009",
     "replace_age_grp_from": "85To89",
     "replace_age_grp_to": "85",
-    "age_grp_func": _get_age_grp_county_2000_2009
+    "age_grp_table": _AGE_GRP_COUNTY_2000_2009_TABLE
 }
 
 _COUNTY_2010_2020_INFO = {
@@ -164,7 +305,7 @@ _COUNTY_2010_2020_INFO = {
     "derived_cols_string": "county_2010_2020",
     "replace_age_grp_from": "85To89",
     "replace_age_grp_to": "85",
-    "age_grp_func": _get_age_grp
+    "age_grp_table": _AGE_GRP_TABLE
 }
 
 
@@ -180,44 +321,24 @@ def _add_measurement_method(data_df: pd.DataFrame, src_col: str,
     Returns:
         pd.DataFrame: DataFrame with New Columns
     """
-    data_df[tgt_col] = data_df[src_col].str.split("_").str[-1]
-    data_df[tgt_col] = data_df[tgt_col].str.replace(r"^(?!computed).*",
-                                                    "dcs:CensusPEPSurvey",
-                                                    regex=True)
-    data_df[tgt_col] = data_df[tgt_col].str.replace(
-        "computed", "dcs:dcAggregate/CensusPEPSurvey", regex=False)
-
+    # The SV column holds at most a few hundred distinct names, so the
+    # string work is done once per unique SV and broadcast with map
+    # instead of running over every row.
     # Dervied SV"s has "_computed" as part of the name,
     # to differentiate them with source generated SV"s
     # Removing "_computed" in the SV"s names.
-    data_df[src_col] = data_df[src_col].str.replace("_computed", "")
+    method_mapper, sv_mapper = {}, {}
+    for sv in data_df[src_col].unique():
+        if sv.endswith("_computed"):
+            method_mapper[sv] = "dcs:dcAggregate/CensusPEPSurvey"
+        else:
+            method_mapper[sv] = "dcs:CensusPEPSurvey"
+        sv_mapper[sv] = sv.replace("_computed", "")
+    data_df[tgt_col] = data_df[src_col].map(method_mapper)
+    data_df[src_col] = data_df[src_col].map(sv_mapper)
     return data_df
 
 
-def _measurement_conditions(sv: str, year: int) -> str:
-    """
-    Divides the Races before and after 2000, by using different measurement
-    methods.
-    Args:
-        sv (str)  : SV Name
-        int (str) : Year
-    Returns:
-        measurement_method (str) : Returns Measurement Method
-    """
-    measurement_method = ""
-    if ((not sv.lower().endswith('male')) and
-        (not sv.lower().endswith('latino') or
-         "WhiteAloneNot" in sv)) and year >= 2000:
-        measurement_method = "_Race2000Onwards"
-    elif ((not sv.lower().endswith('male')) and
-          (not sv.lower().endswith('latino') or
-           "WhiteAloneNot" in sv)) and year < 2000:
-        measurement_method = "_RaceUpto1999"
-    else:
-        measurement_method = ""
-    return measurement_method
-
-
 def _measurement_aggregate(df: pd.DataFrame) -> pd.DataFrame:
     """
     Checks for aggregations done and makes all the years of that race and
@@ -248,17 +369,47 @@ def _measurement_method(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     df = _measurement_aggregate(df)
-    func = np.vectorize(_measurement_conditions)
-    race_year = func(df['SV'], df['Year'].astype('int'))
+    # Divides the Races before and after 2000, by using different
+    # measurement methods. Whether an SV names a race is decided once
+    # per unique SV and broadcast; the year split is a plain mask.
+    race_sv_mapper = {
+        sv: (not sv.lower().endswith('male')) and
+            (not sv.lower().endswith('latino') or
+             "WhiteAloneNot" in sv) for sv in df['SV'].unique()
+    }
+    is_race_sv = df['SV'].map(race_sv_mapper).to_numpy()
+    from_2000 = df['Year'].astype('int').to_numpy() >= 2000
+    race_year = np.where(
+        is_race_sv, np.where(from_2000, "_Race2000Onwards", "_RaceUpto1999"),
+        "")
     df['Measurement_Method'] = df['Measurement_Method'] + race_year
     return df
 
 
+def _is_origin_col(col: str) -> bool:
+    """
+    Column filter for the wide 2000-2020 nationals and county files.
+    Keeps the identifier columns and the population columns whose full
+    name carries a Hispanic origin, which are the only ones those
+    processors read; read_csv skips parsing the rest.
+    Args:
+        col (str): Raw Dataset Header
+
+    Returns:
+        bool: True when the column has to be loaded
+    """
+    if col in ("MONTH", "YEAR", "AGE", "AGEGRP", "STATE", "COUNTY"):
+        return True
+    full_name = _get_mapper_cols_dict("header_mappers").get(col, col)
+    return "Hispanic" in full_name
+
+
 def _load_data_df(path: str,
                   file_format: str,
                   header: str = None,
                   skip_rows: int = None,
-                  encoding: str = "UTF-8") -> pd.DataFrame:
+                  encoding: str = "UTF-8",
+                  usecols=None) -> pd.DataFrame:
     """
     Returns the DataFrame using input path and config.
     Args:
@@ -271,18 +422,23 @@ def _load_data_df(path: str,
         This is helpful to skip initial rows in txt file.Defaults to None.
         encoding (str, optional): Input File Encoding while
         loading data into DataFrame.Defaults to None.
+        usecols (optional): Column subset passed through to read_csv
+        for csv files. Defaults to None, loading every column.
 
     Returns:
         data_df (pd.DataFrame): Dataframe of input file
     """
     data_df = None
     if file_format.lower() == "csv":
-        data_df = pd.read_csv(path, header=header, encoding=encoding)
+        data_df = pd.read_csv(path,
+                              header=header,
+                              encoding=encoding,
+                              usecols=usecols)
     elif file_format.lower() == "txt":
         data_df = pd.read_table(path,
                                 index_col=False,
                                 delim_whitespace=True,
-                                engine="python",
+                                engine="c",
                                 header=header,
                                 skiprows=skip_rows,
                                 encoding=encoding)
@@ -292,13 +448,26 @@ def _load_data_df(path: str,
     return data_df
 
 
-def _create_sv_with_age(desc: str, age: str) -> str:
+def _create_sv_with_age(desc: pd.Series, age: pd.Series) -> pd.Series:
+    """
+    Returns the SV column built from the SV description and Age
+    columns, operating on the whole columns at once.
+    Args:
+        desc (pd.Series): SV Description Column
+        age (pd.Series): Age Column
+
+    Returns:
+        pd.Series: SV Column
+    """
+    age_str = age.astype("str")
     # Age 85+ and 100+ are represented as individual
     # age numbers such as  85, 100.
     # Adding "OrMoreYears" for 85 and 100 Ages.
-    if age in {100, 85}:
-        return f"Count_Person_{age}OrMoreYears_{desc}"
-    return f"Count_Person_{age}Years_{desc}"
+    or_more = age.isin([100, 85])
+    return pd.Series(np.where(or_more,
+                              "Count_Person_" + age_str + "OrMoreYears_" + desc,
+                              "Count_Person_" + age_str + "Years_" + desc),
+                     index=desc.index)
 
 
 def _process_nationals_1980_1989(file_path: str) -> pd.DataFrame:
@@ -329,9 +498,8 @@ def _process_nationals_1980_1989(file_path: str) -> pd.DataFrame:
     # column as 788100, so filtering that row separately
     # and loading it to another DataFrame yr_100_data_df
     # yr_100_data_df contains rows with age 100
-    yr_100_data_df = data_df[data_df[1] == yr_100].iloc[:, 1:].reset_index(
-        drop=True)
-    data_df = data_df[data_df[1] == yr].iloc[:, 1:].reset_index(drop=True)
+    yr_100_data_df = data_df[data_df[1] == yr_100].iloc[:, 1:]
+    data_df = data_df[data_df[1] == yr].iloc[:, 1:]
     cols = [
         "Year", "Age", "Total_Population", "Total_Male_Population",
         "Total_Female_Population", "Male_WhiteAlone_Population",
@@ -359,17 +527,16 @@ def _process_nationals_1980_1989(file_path: str) -> pd.DataFrame:
         # column 23 has NAN value, and dropping that column
         yr_100_data_df = yr_100_data_df.drop(columns=[23])
         yr_100_data_df.columns = cols
-        data_df = pd.concat([data_df, yr_100_data_df]).reset_index(drop=True)
+        data_df = pd.concat([data_df, yr_100_data_df], ignore_index=True)
     # Type casting dataframe values to int.
     data_df = _convert_to_int(data_df)
     # Creating Year Column
     data_df["Year"] = "19" + data_df["Year"].astype("str").str[-2:]
     hispanic_cols = _get_mapper_cols_dict("nationals_1980_1999_hispanic")
-    # Deriving Columns for HispanicOrLatino Origin
+    # Deriving Columns for HispanicOrLatino Origin by subtracting the
+    # NotHispanicOrLatino columns from the total column.
     for dsv, sv in hispanic_cols.items():
-        data_df[sv[1:]] = -data_df[sv[1:]]
-        data_df[dsv] = data_df.loc[:, sv].sum(axis=1)
-        data_df[sv[1:]] = -data_df[sv[1:]]
+        data_df[dsv] = data_df[sv[0]] - data_df[sv[1:]].sum(axis=1)
         cols.append(dsv)
     # Deriving New Columns
     derived_cols = _get_mapper_cols_dict("nationals_1980_1999_derived")
@@ -393,14 +560,9 @@ def _process_nationals_1980_1989(file_path: str) -> pd.DataFrame:
     # 1999    2     HispaicOrLatino_Male         13452
     # 1999    1   HispaicOrLatino_Female         15678
     # 1999    2   HispaicOrLatino_Female         11980
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Age"],
-                      value_vars=pop_cols,
-                      var_name="SV",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df, id_vars=["Year", "Age"], value_vars=pop_cols)
     # Creating SV"s name using SV, Age Column
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     data_df["SV"] = data_df["SV"].str.replace("85OrMore", "85")
     data_df["Location"] = "country/USA"
     final_cols = [
@@ -412,11 +574,13 @@ def _process_nationals_1980_1989(file_path: str) -> pd.DataFrame:
 
 
 def _derive_nationals_1990_1999(data_df: pd.DataFrame) -> pd.DataFrame:
-    data_df["Location"] = "country/USA"
-    data_df = data_df.groupby(
-        by=["Year", "Location", "SV", "Measurement_Method"]).agg({
-            "Count_Person": "sum"
-        }).reset_index()
+    # Aggregating states to the national level; grouping without the
+    # Location column leaves the caller's frame untouched and the
+    # constant country/USA is inserted into the aggregate afterwards.
+    data_df = data_df.groupby(by=["Year", "SV", "Measurement_Method"]).agg({
+        "Count_Person": "sum"
+    }).reset_index()
+    data_df.insert(1, "Location", "country/USA")
     return data_df
 
 
@@ -431,11 +595,14 @@ def _process_nationals_2000_2009(file_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned DataFrame
     """
-    data_df = _load_data_df(path=file_path, file_format="csv", header=0)
+    data_df = _load_data_df(path=file_path,
+                            file_format="csv",
+                            header=0,
+                            usecols=_is_origin_col)
     # Considering Month = 7(July) and Skipping Age:999(Total Age)
     # Skipping Year: 2010
     data_df = data_df[(data_df["MONTH"] == 7) & (data_df["AGE"] != 999) &
-                      (data_df["YEAR"] != 2010)].reset_index(drop=True)
+                      (data_df["YEAR"] != 2010)]
     # data_df columns
     # 'MONTH', 'YEAR', 'AGE', 'TOT_POP', 'TOT_MALE', 'TOT_FEMALE', 'WA_MALE',
     # 'WA_FEMALE', 'BA_MALE', 'BA_FEMALE', 'IA_MALE', 'IA_FEMALE', 'AA_MALE',
@@ -446,13 +613,10 @@ def _process_nationals_2000_2009(file_path: str) -> pd.DataFrame:
     # 'H_FEMALE', 'HWA_MALE', 'HWA_FEMALE', 'HBA_MALE', 'HBA_FEMALE',
     # 'HIA_MALE', 'HIA_FEMALE', 'HAA_MALE', 'HAA_FEMALE', 'HNA_MALE',
     # 'HNA_FEMALE', 'HTOM_MALE', 'HTOM_FEMALE'
-    cols = list(data_df.columns)
     # Mapping Dataset Headers to its FullForm
     cols_mapper = _get_mapper_cols_dict("header_mappers")
-    cols_with_full_name = []
-    for val in cols:
-        cols_with_full_name.append(cols_mapper.get(val, val))
-    data_df.columns = cols_with_full_name
+    data_df = data_df.rename(columns=cols_mapper)
+    cols_with_full_name = data_df.columns.to_list()
     derived_cols = _get_mapper_cols_dict("nationals_2000_2009")
     # Deriving New Columns
     data_df = _derive_cols(data_df, derived_cols)
@@ -460,19 +624,13 @@ def _process_nationals_2000_2009(file_path: str) -> pd.DataFrame:
         val for val in cols_with_full_name + list(derived_cols.keys())
         if "Hispanic" in val
     ]
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Age"],
-                      value_vars=pop_cols,
-                      var_name="SV",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df, id_vars=["Year", "Age"], value_vars=pop_cols)
     # Creating SV"s name using SV, Age Columns
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     data_df["Location"] = "country/USA"
     final_cols = [
         "Year", "Location", "SV", "Measurement_Method", "Count_Person"
     ]
-    data_df = data_df.reset_index(drop=True)
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
     return data_df[final_cols]
@@ -489,10 +647,12 @@ def _process_nationals_2010_2021(file_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned DataFrame
     """
-    data_df = _load_data_df(path=file_path, file_format="csv", header=0)
+    data_df = _load_data_df(path=file_path,
+                            file_format="csv",
+                            header=0,
+                            usecols=_is_origin_col)
     # Considering Month = 7(July) and Skipping Age:999(Total Age)
-    data_df = data_df[(data_df["AGE"] != 999) &
-                      (data_df["MONTH"] == 7)].reset_index(drop=True)
+    data_df = data_df[(data_df["AGE"] != 999) & (data_df["MONTH"] == 7)]
     cols_mapper = _get_mapper_cols_dict("header_mappers")
     data_df.columns = data_df.columns.map(cols_mapper)
     cols = data_df.columns.to_list()
@@ -504,14 +664,9 @@ def _process_nationals_2010_2021(file_path: str) -> pd.DataFrame:
         col for col in cols + list(derived_cols.keys()) if "Hispanic" in col
     ]
     data_df = data_df[cols]
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Age"],
-                      value_vars=cols[2:],
-                      var_name="SV",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df, id_vars=["Year", "Age"], value_vars=cols[2:])
     # Creating SV"s name using SV, Age Column
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     data_df["SV"] = data_df["SV"].str.replace("85OrMore", "85")
     data_df["Location"] = "country/USA"
     data_df = data_df.drop(columns=["Age"])
@@ -537,9 +692,7 @@ def _process_state_1980_1989(file_path: str) -> str:
     data_df = _load_data_df(path=file_path, file_format="txt", header=None)
     # Adding Leading Zeros for Fips Code in the zeroth column.
     #  Before padding STATE = 1006, After padding STATE = 01006
-    data_df[0] = data_df[0].astype("str").str.pad(width=5,
-                                                  side="left",
-                                                  fillchar="0")
+    data_df[0] = data_df[0].astype("str").str.zfill(5)
     start, end = 0, 4
     pop_cols = []
     while True:
@@ -578,21 +731,15 @@ def _process_state_1980_1989(file_path: str) -> str:
     data_df[pop_cols] = data_df[pop_cols].apply(pd.to_numeric)
     derived_cols = _get_mapper_cols_dict("state_1980_1989")
     data_df = data_df[["Year", "Location", "SV"] + pop_cols]
-    for dsv, sv in derived_cols.items():
-        tmp_derived_cols_df = data_df[data_df["SV"].isin(sv)].reset_index(
-            drop=True)
-        tmp_derived_cols_df["SV"] = dsv
-        tmp_derived_cols_df = tmp_derived_cols_df.groupby(
-            ["Year", "Location", "SV"]).sum().reset_index()
-        data_df = pd.concat([data_df, tmp_derived_cols_df])
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Location", "SV"],
-                      value_vars=pop_cols,
-                      var_name="Age",
-                      value_name='Count_Person')
+    derived_df = _derive_sum_svs(data_df, derived_cols,
+                                 ["Year", "Location", "SV"])
+    data_df = pd.concat([data_df, derived_df])
+    data_df = _unpivot_df(data_df,
+                          id_vars=["Year", "Location", "SV"],
+                          value_vars=pop_cols,
+                          var_name="Age")
     # Creating SV"s name using SV, Age Column
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
     data_df = data_df[[
@@ -639,27 +786,20 @@ def _process_state_1990_1999(file_path):
     # Deriving New Columns
     data_df = _derive_cols(data_df, derived_cols)
 
-    # Adding Leading Zeros for State"s Fips Code.
-    # Before padding Location = 6, After padding Location = 06
-    data_df["Location"] = data_df["Location"].astype("str").str.pad(
-        width=2, side="left", fillchar="0")
-    # Creating GeoId"s using Fips Code
-    data_df["Location"] = "geoId/" + data_df["Location"]
+    # Creating GeoId"s using zero-padded Fips Code
+    # Before padding Location = 6, After padding Location = geoId/06
+    data_df["Location"] = _to_geoid(data_df["Location"], 2)
     # Extracting columns having Hispanic and NotHispanic
     pop_cols = [
         val for val in cols + list(derived_cols.keys()) if "Hispanic" in val
     ]
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Location", "Age"],
-                      value_vars=pop_cols,
-                      var_name="SV",
-                      value_name='Count_Person')
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df = _unpivot_df(data_df,
+                          id_vars=["Year", "Location", "Age"],
+                          value_vars=pop_cols)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     final_cols = [
         "Year", "Location", "SV", "Measurement_Method", "Count_Person"
     ]
-    data_df = data_df.reset_index(drop=True)
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
     return data_df[final_cols]
@@ -680,9 +820,7 @@ def _process_state_2000_2010(file_path: str) -> pd.DataFrame:
     data_df = data_df.drop(columns=["POPESTIMATE2010"])
     # STATE COLUMN with 0 value has national data,
     # So, skipping  the national data rows
-    data_df = data_df[(data_df["STATE"] != 0)].reset_index(drop=True)
-    data_df = data_df.reset_index()
-    derived_cols_df = pd.DataFrame()
+    data_df = data_df[(data_df["STATE"] != 0)]
     gender_mapper = {0: "empty", 1: "Male", 2: "Female"}
     origin_mapper = {1: "NotHispanicOrLatino", 2: "HispanicOrLatino"}
     race_mapper = {
@@ -695,35 +833,31 @@ def _process_state_2000_2010(file_path: str) -> pd.DataFrame:
         6: "TwoOrMoreRaces"
     }
     # Deriving New Columns and actual values for below numbers are
-    # represented in above dictonaries
+    # represented in above dictonaries.
+    # Each (ORIGIN, SEX, RACE) combination below is a pre-aggregated
+    # slice in the source file. Instead of concatenating one frame per
+    # combination, the wanted rows are picked with a single mask and
+    # stable-sorted back into the per-slice selection order.
+    slice_order = {}
     for origin in [1, 2]:
-        derived_cols_df = pd.concat([
-            derived_cols_df,
-            data_df[(data_df["ORIGIN"] == origin) & (data_df["SEX"] == 0) &
-                    (data_df["RACE"] == 0) & (data_df["AGEGRP"] != 0)]
-        ],
-                                    ignore_index=True)
+        slice_order[(origin, 0, 0)] = len(slice_order)
         for sex in [0, 1, 2]:
             if sex == 0:
                 for race in [1, 2, 3, 4, 5, 6]:
-                    derived_cols_df = pd.concat([
-                        derived_cols_df, data_df[(data_df["ORIGIN"] == origin) &
-                                                 (data_df["SEX"] == 0) &
-                                                 (data_df["RACE"] == race) &
-                                                 (data_df["AGEGRP"] != 0)]
-                    ],
-                                                ignore_index=True)
+                    slice_order[(origin, 0, race)] = len(slice_order)
             else:
-                derived_cols_df = pd.concat([
-                    derived_cols_df, data_df[(data_df["ORIGIN"] == origin) &
-                                             (data_df["SEX"] == sex) &
-                                             (data_df["RACE"] == 0) &
-                                             (data_df["AGEGRP"] != 0)]
-                ],
-                                            ignore_index=True)
+                slice_order[(origin, sex, 0)] = len(slice_order)
+    position = (data_df["ORIGIN"].astype("int") * 100 + data_df["SEX"] * 10 +
+                data_df["RACE"]).map({
+                    origin * 100 + sex * 10 + race: pos
+                    for (origin, sex, race), pos in slice_order.items()
+                })
+    derived_mask = position.notna() & (data_df["AGEGRP"] != 0)
+    derived_cols_df = data_df[derived_mask]
+    derived_cols_df = derived_cols_df.iloc[np.argsort(
+        position[derived_mask].to_numpy(), kind="stable")]
     data_df = data_df[(data_df["SEX"] != 0) & (data_df["RACE"] != 0) &
-                      (data_df["ORIGIN"] != 0) &
-                      (data_df["AGEGRP"] != 0)].reset_index(drop=True)
+                      (data_df["ORIGIN"] != 0) & (data_df["AGEGRP"] != 0)]
     data_df = pd.concat([data_df, derived_cols_df], ignore_index=True)
     data_df["RACE"] = data_df["RACE"].map(race_mapper)
     data_df["ORIGIN"] = data_df["ORIGIN"].map(origin_mapper)
@@ -737,9 +871,8 @@ def _process_state_2000_2010(file_path: str) -> pd.DataFrame:
     data_df["SV"] = data_df["SV"].str.replace("empty_",
                                               "").str.replace("_empty", "")
     # Adding Leading Zeros for State"s Fips Code.
-    # Before padding STATE = 6, After padding STATE = 06
-    data_df["Location"] = "geoId/" + data_df["STATE"].astype("str").str.pad(
-        width=2, side="left", fillchar="0")
+    # Before padding STATE = 6, After padding STATE = geoId/06
+    data_df["Location"] = _to_geoid(data_df["STATE"], 2)
     # data_df.columns
     # 'index', 'REGION', 'DIVISION', 'STATE', 'NAME', 'SEX', 'ORIGIN', 'RACE',
     # 'AGEGRP', 'ESTIMATESBASE2000', 'POPESTIMATE2000', 'POPESTIMATE2001',
@@ -749,9 +882,8 @@ def _process_state_2000_2010(file_path: str) -> pd.DataFrame:
     # 'SV', 'Location'
     cols = data_df.columns.to_list()
     # Creating Age Groups
-    data_df["Age"] = data_df["AGEGRP"].apply(_get_age_grp)
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["Age"] = _AGE_GRP_TABLE[data_df["AGEGRP"].to_numpy()]
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     req_cols = ["Location", "SV"
                ] + [col for col in cols if col.startswith("POPESTIMATE")]
     data_df = data_df[req_cols]
@@ -764,11 +896,10 @@ def _process_state_2000_2010(file_path: str) -> pd.DataFrame:
     # data_df Columns
     # ["Location", "SV", "2000", "2001", "2002", "2003",
     # "2004", "2005", "2006", "2007", "2008", "2009"]
-    data_df = pd.melt(data_df,
-                      id_vars=["Location", "SV"],
-                      value_vars=pop_cols,
-                      var_name="Year",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df,
+                          id_vars=["Location", "SV"],
+                          value_vars=pop_cols,
+                          var_name="Year")
     data_df = data_df[["Year", "Location", "SV", "Count_Person"]]
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
@@ -790,13 +921,11 @@ def _process_state_2010_2020(file_path: str) -> pd.DataFrame:
     """
     data_df = _load_data_df(path=file_path, file_format="csv", header=0)
     # SKipping Sex: 0, Origin: 0 which represents Total Count
-    data_df = data_df[(data_df["SEX"] != 0) &
-                      (data_df["ORIGIN"] != 0)].reset_index(drop=True)
+    data_df = data_df[(data_df["SEX"] != 0) & (data_df["ORIGIN"] != 0)]
 
     # Creating GeoId"s for State FIPS Code
-    # Before padding STATE = 6, After padding STATE = 06
-    data_df["STATE"] = "geoId/" + data_df["STATE"].astype("str").str.pad(
-        width=2, side="left", fillchar="0")
+    # Before padding STATE = 6, After padding STATE = geoId/06
+    data_df["STATE"] = _to_geoid(data_df["STATE"], 2)
     gender_mapper = {1: "Male", 2: "Female"}
     origin_mapper = {1: "NotHispanicOrLatino", 2: "HispanicOrLatino"}
     race_mapper = {
@@ -842,26 +971,17 @@ def _process_state_2010_2020(file_path: str) -> pd.DataFrame:
     # Type Casting the pop_cols to integer/float using pd.to_numeric function
     data_df[pop_cols] = data_df[pop_cols].apply(pd.to_numeric)
     derived_cols = _get_mapper_cols_dict("state_2010_2020_hispanic")
-    for dsv, sv in derived_cols.items():
-        tmp_derived_cols_df = data_df[data_df["SV"].isin(
-            sv)][req_cols].reset_index(drop=True)
-        tmp_derived_cols_df["SV"] = dsv
-        tmp_derived_cols_df = tmp_derived_cols_df.groupby(
-            ["STATE", "SV", "AGE"]).sum().reset_index()
-        data_df = pd.concat([data_df, tmp_derived_cols_df])
+    derived_df = _derive_sum_svs(data_df[req_cols], derived_cols,
+                                 ["STATE", "SV", "AGE"])
+    data_df = pd.concat([data_df, derived_df])
     # Deriving New Columns
     derived_cols = _get_mapper_cols_dict("state_2010_2020_total")
-    for dsv, sv in derived_cols.items():
-        tmp_derived_cols_df = data_df[data_df["SV"].isin(
-            sv)][req_cols].reset_index(drop=True)
-        tmp_derived_cols_df["SV"] = dsv
-        tmp_derived_cols_df = tmp_derived_cols_df.groupby(
-            ["STATE", "SV", "AGE"]).sum().reset_index()
-        data_df = pd.concat([data_df, tmp_derived_cols_df])
+    derived_df = _derive_sum_svs(data_df[req_cols], derived_cols,
+                                 ["STATE", "SV", "AGE"])
+    data_df = pd.concat([data_df, derived_df])
     # Creating SV"s name using SV, Age Column
 
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.AGE), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["AGE"])
     data_df = data_df[req_cols]
     req_cols = [
         col.replace("POPESTIMATE", "").replace("STATE", "Location")
@@ -871,11 +991,10 @@ def _process_state_2010_2020(file_path: str) -> pd.DataFrame:
     # data_df Columns or req_cols are below
     # ["Location", "SV", "AGE", "2010", "2011", "2012",
     # "2013", "2014", "2015", "2016", "2017", "2018", "2019", "2020"]
-    data_df = pd.melt(data_df,
-                      id_vars=["SV", "Location", "AGE"],
-                      value_vars=req_cols[3:],
-                      var_name="Year",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df,
+                          id_vars=["SV", "Location", "AGE"],
+                          value_vars=req_cols[3:],
+                          var_name="Year")
     f_cols = ["Year", "Location", "SV", "Measurement_Method", "Count_Person"]
     data_df["Count_Person"] = data_df["Count_Person"].astype("int")
     # Deriving Measurement Method for the SV"s
@@ -894,45 +1013,42 @@ def _process_county_1990_1999(file_path: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned DataFrame.
     """
-    final_data = []
     # Reading txt file and filtering required rows
-    prev_origin_race_cat = None
-    curr_origin_race_cat = None
-    data = []
-    skipped_rows = []
+    rows = []
     with open(file_path, "r", encoding="latin-1") as file:
         for lines in file.readlines():
             lines = lines.split(" ")
             lines = [line.strip() for line in lines if line.strip().isnumeric()]
             if len(lines) == 21:
-                data.append(lines)
-                if prev_origin_race_cat is None:
-                    prev_origin_race_cat = lines[2]
-                elif curr_origin_race_cat is None:
-                    curr_origin_race_cat = lines[2]
-                if len(data) == 2:
-                    # Row level aggregation is calculated
-                    # thru pairs (1,2), (3,4) and (11,12)
-                    # Dervied SV"s are below
-                    # WhiteAloneNotHispanicOrLatino: 1 + 2
-                    # HispanicOrLatino_WhiteAlone: 3 + 4
-                    # HispanicOrLatino: 11 + 12
-                    # Few rows were dropped due to unreadable characters,
-                    # aggregation can be performed only when the pairs
-                    # are available
-                    if [prev_origin_race_cat,
-                            curr_origin_race_cat] in [["1", "2"], ["3", "4"],
-                                                      ["11", "12"]]:
-                        final_data = final_data + data
-                        data = []
-                        prev_origin_race_cat = None
-                        curr_origin_race_cat = None
-                    else:
-                        skipped_rows.append(data.pop(0))
-                        prev_origin_race_cat = curr_origin_race_cat
-                        curr_origin_race_cat = None
-    data_df = pd.DataFrame(final_data)
-    skipped_data_df = pd.DataFrame(skipped_rows)
+                rows.append(lines)
+    # Row level aggregation is calculated
+    # thru pairs (1,2), (3,4) and (11,12)
+    # Dervied SV"s are below
+    # WhiteAloneNotHispanicOrLatino: 1 + 2
+    # HispanicOrLatino_WhiteAlone: 3 + 4
+    # HispanicOrLatino: 11 + 12
+    # Few rows were dropped due to unreadable characters,
+    # aggregation can be performed only when the pairs
+    # are available
+    # The pair codes never overlap (no code both closes one pair and
+    # opens another), so a row opens a pair exactly when its code and
+    # the next row's code line up. That makes the old sequential scan
+    # equivalent to one vectorized comparison of the code column
+    # against its shift.
+    rows_arr = np.array(rows, dtype=object)
+    sv_codes = rows_arr[:, 2]
+    opens_pair = ((sv_codes[:-1] == "1") & (sv_codes[1:] == "2")) | \
+                 ((sv_codes[:-1] == "3") & (sv_codes[1:] == "4")) | \
+                 ((sv_codes[:-1] == "11") & (sv_codes[1:] == "12"))
+    kept = np.zeros(len(rows), dtype=bool)
+    kept[:-1] = opens_pair
+    kept[1:] |= opens_pair
+    skipped = ~kept
+    # A trailing unpaired row never finds a partner and is dropped
+    # outright, not routed to the skipped frame.
+    skipped[-1] = False
+    data_df = pd.DataFrame(rows_arr[kept])
+    skipped_data_df = pd.DataFrame(rows_arr[skipped])
     pop_cols = [
         "0To4", "5To9", "10To14", "15To19", "20To24", "25To29", "30To34",
         "35To39", "40To44", "45To49", "50To54", "55To59", "60To64", "65To69",
@@ -940,50 +1056,31 @@ def _process_county_1990_1999(file_path: str) -> pd.DataFrame:
     ]
     data_df.columns = ["Year", "Location", "SV"] + pop_cols
     skipped_data_df.columns = ["Year", "Location", "SV"] + pop_cols
-    sv_mapper = {
-        "1": "Male_WhiteAloneNotHispanicOrLatino",
-        "2": "Female_WhiteAloneNotHispanicOrLatino",
-        "3": "Male_HispanicOrLatino_WhiteAlone",
-        "4": "Female_HispanicOrLatino_WhiteAlone",
-        "5": "Male_BlackOrAfricanAmericanAlone",
-        "6": "Female_BlackOrAfricanAmericanAlone",
-        "7": "Male_AmericanIndianAndAlaskaNativeAlone",
-        "8": "Female_AmericanIndianAndAlaskaNativeAlone",
-        "9": "Male_AsianOrPacificIslander",
-        "10": "Female_AsianOrPacificIslander",
-        "11": "Male_HispanicOrLatino",
-        "12": "Female_HispanicOrLatino"
-    }
     # Removing SV"s from 5 to 10 as they are not part of origin
     # HispanicOrlatino (or) NotHispanicOrLatino
-    data_df = data_df[~data_df["SV"].isin(["5", "6", "7", "8", "9", "10"]
-                                         )].reset_index(drop=True)
-    skipped_data_df = skipped_data_df[~skipped_data_df["SV"].isin(
-        ["5", "6", "7", "8", "9", "10"])].reset_index(drop=True)
-    data_df["SV"] = data_df["SV"].map(sv_mapper)
-    skipped_data_df["SV"] = skipped_data_df["SV"].map(sv_mapper)
+    data_df = data_df[~data_df["SV"].isin(["5", "6", "7", "8", "9", "10"])]
+    skipped_data_df = skipped_data_df[~skipped_data_df["SV"].
+                                      isin(["5", "6", "7", "8", "9", "10"])]
+    data_df["SV"] = data_df["SV"].map(_SV_MAPPER)
+    skipped_data_df["SV"] = skipped_data_df["SV"].map(_SV_MAPPER)
     derived_cols = _get_mapper_cols_dict("county_1900_1999")
     data_df[pop_cols] = data_df[pop_cols].apply(pd.to_numeric)
-    data = None
-    for dsv, sv in derived_cols.items():
-        data = data_df[data_df["SV"].isin(sv)].reset_index(drop=True)
-        data["SV"] = dsv
-        data = data.groupby(["Year", "Location", "SV"]).sum().reset_index()
-        data_df = pd.concat([data_df, data])
+    derived_df = _derive_sum_svs(data_df, derived_cols,
+                                 ["Year", "Location", "SV"])
+    data_df = pd.concat([data_df, derived_df])
     data_df = pd.concat([data_df, skipped_data_df])
-    data_df = data_df.dropna()
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Location", "SV"],
-                      value_vars=pop_cols,
-                      var_name="Age",
-                      value_name='Count_Person')
+    data_df = _unpivot_df(data_df,
+                          id_vars=["Year", "Location", "SV"],
+                          value_vars=pop_cols,
+                          var_name="Age")
+    # Year, Location and SV are guaranteed by the parser above; only the
+    # count cells can be null, so restrict the null scan to Count_Person.
+    data_df = data_df.dropna(subset=["Count_Person"])
     # Creating SV"s name using SV, Age Column
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     # Creating GeoId"s for County FIPS Code
-    # Before padding Location = 1001, After padding Location = 01001
-    data_df["Location"] = "geoId/" + data_df["Location"].astype("str").str.pad(
-        width=5, side="left", fillchar="0")
+    # Before padding Location = 1001, After padding Location = geoId/01001
+    data_df["Location"] = _to_geoid(data_df["Location"], 5)
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
     data_df = data_df[[
@@ -1007,49 +1104,40 @@ def _process_county_2000_2020(file_path: str,
     data_df = _load_data_df(path=file_path,
                             file_format="csv",
                             header=0,
-                            encoding="latin-1")
-    data_df = data_df[(~data_df["YEAR"].isin(county_conf["exclude_year"])) & (
-        data_df["AGEGRP"] != county_conf["exclude_age_grp"])].reset_index(
-            drop=True)
+                            encoding="latin-1",
+                            usecols=_is_origin_col)
+    data_df = data_df[(~data_df["YEAR"].isin(county_conf["exclude_year"])) &
+                      (data_df["AGEGRP"] != county_conf["exclude_age_grp"])]
     if "replace_year_from" in county_conf.keys():
-        data_df["YEAR"] = data_df["YEAR"].astype("str").str.replace(
-            county_conf["replace_year_from"],
-            county_conf["replace_year_to"]).astype("int")
-    data_df["YEAR"] = county_conf["add_base_year"] + data_df["YEAR"]
+        data_df["YEAR"] = np.where(
+            data_df["YEAR"] == int(county_conf["replace_year_from"]),
+            int(county_conf["replace_year_to"]), data_df["YEAR"])
+    data_df["YEAR"] = county_conf["add_base_year"] + data_df["YEAR"].astype(
+        "int")
     # Mapping Dataset Headers to its FullForm
     cols_mapper = _get_mapper_cols_dict("header_mappers")
+    data_df = data_df.rename(columns=cols_mapper)
     cols = data_df.columns.to_list()
-    for idx, val in enumerate(cols):
-        cols[idx] = cols_mapper.get(val, val)
-    data_df.columns = cols
-    # Adding Leading Zeros for State's Fips Code.
-    #  Before padding STATE = 6, After padding STATE = 06
-    data_df["STATE"] = data_df["STATE"].astype("str").str.pad(width=2,
-                                                              side="left",
-                                                              fillchar="0")
-    # Adding Leading Zeros for County's Fips Code.
-    # Before padding COUNTY = 20, After padding COUNTY = 020
-    data_df["COUNTY"] = data_df["COUNTY"].astype("str").str.pad(width=3,
-                                                                side="left",
-                                                                fillchar="0")
-    data_df["Location"] = "geoId/" + data_df["STATE"] + data_df["COUNTY"]
+    # Creating GeoId"s from the State and County Fips Codes.
+    # STATE = 6, COUNTY = 20 gives Location = geoId/06020
+    data_df["Location"] = _build_location(data_df["STATE"], data_df["COUNTY"])
     # Deriving New Columns
     derived_cols = _get_mapper_cols_dict(county_conf["derived_cols_string"])
     data_df = _derive_cols(data_df, derived_cols)
     cols = cols + list(derived_cols.keys())
     f_cols = [val for val in cols if "Hispanic" in val]
-    data_df["Age"] = data_df["AGEGRP"].apply(county_conf["age_grp_func"])
+    # The derived sums come back as int64; shrinking the value columns
+    # before the unpivot cuts the bytes the long frame has to copy.
+    data_df[f_cols] = data_df[f_cols].apply(pd.to_numeric, downcast="integer")
+    data_df["Age"] = county_conf["age_grp_table"][data_df["AGEGRP"].to_numpy()]
     if "replace_age_grp_from" in county_conf.keys():
         data_df["Age"] = data_df["Age"].str.replace(
             county_conf["replace_age_grp_from"],
             county_conf["replace_age_grp_to"])
-    data_df = pd.melt(data_df,
-                      id_vars=["Year", "Location", "Age"],
-                      value_vars=f_cols,
-                      var_name="SV",
-                      value_name='Count_Person')
-    data_df["SV"] = data_df.apply(
-        lambda row: _create_sv_with_age(row.SV, row.Age), axis=1)
+    data_df = _unpivot_df(data_df,
+                          id_vars=["Year", "Location", "Age"],
+                          value_vars=f_cols)
+    data_df["SV"] = _create_sv_with_age(data_df["SV"], data_df["Age"])
     f_cols = ["Year", "Location", "SV", "Measurement_Method", "Count_Person"]
     # Deriving Measurement Method for the SV"s
     data_df = _add_measurement_method(data_df, "SV", "Measurement_Method")
@@ -1079,13 +1167,13 @@ def _generate_mcf(sv_list, mcf_file_path) -> None:
             if prop in ["Count", "Person"]:
                 continue
             if "Years" in prop:
-                if "OrMoreYears" in prop:
-                    pvs.append("age: [" + prop.replace("OrMoreYears", "") +
-                               " - Years]")
-                elif "To" in prop:
-                    pvs.append("age: [" +
-                               prop.replace("Years", "").replace("To", " ") +
-                               " Years]")
+                or_more = _AGE_OR_MORE_PATTERN.match(prop)
+                age_range = _AGE_RANGE_PATTERN.match(prop)
+                if or_more:
+                    pvs.append("age: [" + or_more.group(1) + " - Years]")
+                elif age_range:
+                    pvs.append("age: [" + age_range.group(1) + " " +
+                               age_range.group(2) + " Years]")
                 else:
                     pvs.append("age: [Years " + prop.replace("Years", "") + "]")
             elif "Male" in prop or "Female" in prop:
@@ -1121,6 +1209,47 @@ def _generate_tmcf(tmcf_file_path) -> None:
         f_out.write(_TMCF_TEMPLATE.rstrip("\n"))
 
 
+def _process_file(file_path: str) -> pd.DataFrame:
+    """
+    Dispatches file_path to its decade and geography specific
+    processor and returns the cleaned DataFrame.
+    Args:
+        file_path (str): Input File Path
+
+    Returns:
+        pd.DataFrame: Cleaned DataFrame
+    """
+    data_df = None
+    if "sasr" in file_path:
+        data_df = _process_state_1990_1999(file_path)
+        if "sasrh" in file_path:
+            nat_data_df = _derive_nationals_1990_1999(data_df)
+            data_df = pd.concat([data_df, nat_data_df],
+                                axis=0,
+                                ignore_index=True,
+                                copy=False)
+    elif "st-est00int-alldata" in file_path:
+        data_df = _process_state_2000_2010(file_path)
+    elif "SC-EST2020-ALLDATA6" in file_path:
+        data_df = _process_state_2010_2020(file_path)
+    elif "st_int_asrh" in file_path:
+        data_df = _process_state_1980_1989(file_path)
+    elif "CQI.TXT" in file_path:
+        data_df = _process_nationals_1980_1989(file_path)
+    elif "us-est00int-alldata" in file_path:
+        data_df = _process_nationals_2000_2009(file_path)
+    elif "NC-EST" in file_path:
+        data_df = _process_nationals_2010_2021(file_path)
+    elif "casrh" in file_path:
+        data_df = _process_county_1990_1999(file_path)
+    elif "co-est00int-alldata" in file_path:
+        data_df = _process_county_2000_2020(file_path, _COUNTY_2000_2009_INFO)
+    elif "CC-EST2020" in file_path:
+        data_df = _process_county_2000_2020(file_path, _COUNTY_2010_2020_INFO)
+    data_df = _convert_to_int(data_df)
+    return data_df
+
+
 def process(input_files: list, cleaned_csv_file_path: str, mcf_file_path: str,
             tmcf_file_path: str):
     """
@@ -1130,48 +1259,14 @@ def process(input_files: list, cleaned_csv_file_path: str, mcf_file_path: str,
     output_path = os.path.dirname(cleaned_csv_file_path)
     if not os.path.exists(output_path):
         os.mkdir(output_path)
-    sv_list = []
-    data_df = pd.DataFrame(columns=[[
-        "Year", "Location", "SV", "Measurement_Method", "Count_Person"
-    ]])
-    data_df.to_csv(cleaned_csv_file_path, index=False)
-    for file_path in input_files:
-        data_df = None
-        if "sasr" in file_path:
-            data_df = _process_state_1990_1999(file_path)
-            if "sasrh" in file_path:
-                nat_data_df = _derive_nationals_1990_1999(deepcopy(data_df))
-                data_df = pd.concat([data_df, nat_data_df], axis=0)
-        elif "st-est00int-alldata" in file_path:
-            data_df = _process_state_2000_2010(file_path)
-        elif "SC-EST2020-ALLDATA6" in file_path:
-            data_df = _process_state_2010_2020(file_path)
-        elif "st_int_asrh" in file_path:
-            data_df = _process_state_1980_1989(file_path)
-        elif "CQI.TXT" in file_path:
-            data_df = _process_nationals_1980_1989(file_path)
-        elif "us-est00int-alldata" in file_path:
-            data_df = _process_nationals_2000_2009(file_path)
-        elif "NC-EST" in file_path:
-            data_df = _process_nationals_2010_2021(file_path)
-        elif "casrh" in file_path:
-            data_df = _process_county_1990_1999(file_path)
-        elif "co-est00int-alldata" in file_path:
-            data_df = _process_county_2000_2020(file_path,
-                                                _COUNTY_2000_2009_INFO)
-        elif "CC-EST2020" in file_path:
-            data_df = _process_county_2000_2020(file_path,
-                                                _COUNTY_2010_2020_INFO)
-        data_df = _convert_to_int(data_df)
-
-        data_df.to_csv(cleaned_csv_file_path,
-                       mode="a",
-                       header=False,
-                       index=False)
-        sv_list += data_df["SV"].to_list()
-    sv_list = list(set(sv_list))
-    sv_list.sort()
-    data_df = pd.read_csv(cleaned_csv_file_path, header=0)
+    # Input files are independent of each other, processing them
+    # in parallel. executor.map returns results in submission order,
+    # keeping the output CSV deterministic.
+    max_workers = max(1, min(len(input_files), os.cpu_count()))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        cleaned_dfs = list(executor.map(_process_file, input_files))
+    data_df = pd.concat(cleaned_dfs, ignore_index=True, copy=False)
+    sv_list = sorted(data_df["SV"].unique())
     data_df = _measurement_method(data_df)
     data_df.to_csv(cleaned_csv_file_path, index=False)
     _generate_mcf(sv_list, mcf_file_path)